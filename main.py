@@ -15,6 +15,7 @@ from utils import (
     load_data,
     validate_data,
     preprocess_data,
+    process_in_chunks,
     analyze_data,
     save_results,
     create_sample_data,
@@ -59,12 +60,36 @@ def parse_arguments():
         help="Method for filling missing values (default: mean)"
     )
     
+    parser.add_argument(
+        '--optimize-dtypes',
+        action='store_true',
+        help="Downcast numeric columns and convert low-cardinality text to categories"
+    )
+    
+    parser.add_argument(
+        '--engine',
+        choices=['pandas', 'dask'],
+        default='pandas',
+        help="Backend for text cleaning during preprocessing (default: pandas)"
+    )
+    
     parser.add_argument(
         '--no-correlations',
         action='store_true',
         help="Skip correlation analysis"
     )
     
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        help="Process the input in chunks of this many rows to bound memory use"
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help="Directory for caching analysis results between runs"
+    )
+    
     parser.add_argument(
         '--required-columns',
         nargs='+',
@@ -88,28 +113,38 @@ def main():
         # Handle sample data creation
         if args.create_sample and not Path(args.input).exists():
             print(f"Creating sample data at {args.input}...")
-            create_sample_data(args.input, num_rows=50)
+            create_sample_data(args.input, num_rows=50, return_data=False)
         
-        # Data loading and validation
-        print("Loading and validating data...")
-        data = load_data(args.input)
-        validated_data = validate_data(data, args.required_columns)
+        preprocess_kwargs = {
+            'drop_na': not args.fill_na,
+            'fill_na': args.fill_na,
+            'fill_method': args.fill_method,
+            'engine': args.engine
+        }
         
-        # Data preprocessing
-        print("Preprocessing data...")
-        clean_data = preprocess_data(
-            validated_data, 
-            drop_na=not args.fill_na,
-            fill_na=args.fill_na,
-            fill_method=args.fill_method
-        )
+        if args.chunksize:
+            # Chunked loading and preprocessing, validated once assembled
+            print("Loading and preprocessing data in chunks...")
+            clean_data = process_in_chunks(args.input, args.chunksize, preprocess_kwargs,
+                                           optimize=args.optimize_dtypes)
+            clean_data = validate_data(clean_data, args.required_columns)
+        else:
+            # Data loading and validation
+            print("Loading and validating data...")
+            data = load_data(args.input, optimize=args.optimize_dtypes)
+            validated_data = validate_data(data, args.required_columns)
+            
+            # Data preprocessing
+            print("Preprocessing data...")
+            clean_data = preprocess_data(validated_data, **preprocess_kwargs)
         
         # Data analysis
         print("Analyzing data...")
         results = analyze_data(
             clean_data,
             include_correlations=not args.no_correlations,
-            custom_analysis=True
+            custom_analysis=True,
+            cache_dir=args.cache_dir
         )
         
         # Save results
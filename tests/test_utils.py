@@ -0,0 +1,131 @@
+"""Checks that the helpers in utils.py match the plain pandas behaviour they replace."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils
+
+
+class LoadDataMatchesReadCsvTest(unittest.TestCase):
+    """load_data() must return exactly what pd.read_csv() returns, whichever reader runs."""
+
+    CASES = {
+        'duplicate_headers': 'a,a,b\n1,2,3\n4,5,6\n',
+        'pandas_null_strings': 'x,y\nNone,1\n<NA>,2\nfoo,3\nNULL,4\n',
+        'boolean_spellings': 'b,c\n1,true\ntrue,False\n0,true\n',
+        'all_empty_column': 'n,m\n,1\n,2\n',
+        'signed_integers': 'p,q\n-1,1.0\n+2,2.0\n',
+        'dates_and_text': 's,t,u\nhello,1,2023-01-01\n,2,\nNA,3.5,2023-01-02 10:00\n',
+    }
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmpdir.name, f"{name}.csv")
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_matches_read_csv(self):
+        for name, text in self.CASES.items():
+            with self.subTest(name):
+                path = self._write(name, text)
+                pd.testing.assert_frame_equal(utils.load_data(path), pd.read_csv(path))
+
+    def test_duplicate_headers_fall_back_to_pandas(self):
+        path = self._write('duplicate_headers', self.CASES['duplicate_headers'])
+        self.assertIsNone(utils._read_csv_arrow(path))
+
+
+class DropDuplicatesNumericTest(unittest.TestCase):
+    """_drop_duplicates_numeric() must keep exactly the rows drop_duplicates() keeps."""
+
+    def _assert_matches(self, df):
+        pd.testing.assert_frame_equal(utils._drop_duplicates_numeric(df), df.drop_duplicates())
+
+    def test_high_cardinality_frame_uses_row_hashes(self):
+        rng = np.random.default_rng(0)
+        values = rng.random((20_000, 6))
+        values[rng.choice(20_000, 500)] = values[rng.choice(20_000, 500)]
+        values[::97, 0] = np.nan
+        values[::89, 1] = -0.0
+        values[::83, 1] = 0.0
+        df = pd.DataFrame(values, columns=list('abcdef'))
+        self.assertTrue(utils._row_hashing_pays_off(df))
+        self._assert_matches(df)
+
+    def test_low_cardinality_frame_uses_drop_duplicates(self):
+        df = pd.DataFrame(np.random.default_rng(0).integers(0, 5, (20_000, 4)), columns=list('abcd'))
+        self.assertFalse(utils._row_hashing_pays_off(df))
+        self._assert_matches(df)
+
+
+class SaveResultsTest(unittest.TestCase):
+    """Sidecar files referenced from the JSON must resolve from the JSON's own directory."""
+
+    def test_sidecar_paths_are_relative_to_json(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        stats = pd.DataFrame({'mean': [1.0, 2.0]}, index=['a', 'b'])
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                saved = utils.save_results({'basic_stats': stats}, os.path.join('out', 'results'),
+                                           include_report=False)
+                json_path = os.path.abspath(saved['json'])
+            finally:
+                os.chdir(cwd)
+            with open(json_path) as f:
+                reference = json.load(f)['basic_stats']
+            sidecar = os.path.join(os.path.dirname(json_path), reference)
+            pd.testing.assert_frame_equal(pd.read_parquet(sidecar), stats)
+
+
+class AnalysisCacheTest(unittest.TestCase):
+    """Cached analysis must only be reused for identical data."""
+
+    def test_fingerprint_tracks_content_of_concatenated_text(self):
+        parts = [pd.DataFrame({'name': ['a', 'b'], 'score': [1.0, 2.0]}),
+                 pd.DataFrame({'name': ['c', None], 'score': [3.0, 4.0]})]
+        df = pd.concat(parts, ignore_index=True)
+        changed = df.copy(deep=True)
+        changed.loc[3, 'name'] = 'd'
+        self.assertEqual(utils._frame_fingerprint(df), utils._frame_fingerprint(df.copy(deep=True)))
+        self.assertNotEqual(utils._frame_fingerprint(df), utils._frame_fingerprint(changed))
+
+
+class CreateSampleDataTest(unittest.TestCase):
+    """Batched sample generation must produce the same dates as a single pd.date_range()."""
+
+    def test_multi_batch_dates_match_date_range(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data = utils.create_sample_data(os.path.join(tmpdir, 'sample.csv'),
+                                            num_rows=250, batch_size=100)
+        expected = pd.date_range('2023-01-01', periods=250, freq='D')
+        pd.testing.assert_index_equal(pd.DatetimeIndex(data['Date']), expected,
+                                      check_names=False)
+
+    @unittest.skipIf(pd.date_range('2023-01-01', periods=1).unit == 'ns',
+                     'nanosecond timestamps end in 2262')
+    def test_late_batch_dates_match_date_range(self):
+        expected = pd.date_range('2023-01-01', periods=1_000_000, freq='D')
+        pd.testing.assert_index_equal(utils._sample_dates(999_000, 1_000_000), expected[999_000:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,14 @@
 import pandas as pd
 import numpy as np
 import os
+import copy
+import hashlib
+import pickle
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
 import logging
-from datetime import datetime
+from datetime import date, datetime
 
 # Configure logging
 logging.basicConfig(
@@ -13,22 +17,186 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Copy-on-Write lets preprocessing share column data with its input and copy
+# only the columns it modifies. It is opt-in on pandas 2.x and always on from 3.0.
+_PANDAS_MAJOR = int(pd.__version__.split('.')[0])
+if _PANDAS_MAJOR == 2:
+    pd.set_option('mode.copy_on_write', True)
+_COPY_ON_WRITE = _PANDAS_MAJOR >= 2
+
 def setup_directories(*dirs: str) -> None:
     """Create directories if they don't exist."""
     for directory in dirs:
         Path(directory).mkdir(parents=True, exist_ok=True)
-        logger.info(f"Directory ensured: {directory}")
+        logger.info("Directory ensured: %s", directory)
+
+# pd.read_csv()'s default missing-value and boolean spellings, passed to Arrow
+# so both readers agree on what is NaN, True and False
+_PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+_PANDAS_TRUE_VALUES = ['True', 'TRUE', 'true']
+_PANDAS_FALSE_VALUES = ['False', 'FALSE', 'false']
+
+def _numeric_or_original(series: pd.Series) -> pd.Series:
+    """Convert a text column to numbers as pd.read_csv() would, leaving it as text otherwise."""
+    try:
+        return pd.to_numeric(series)
+    except (ValueError, TypeError):
+        return series
 
-def load_data(filepath: str, **kwargs) -> pd.DataFrame:
+def _read_csv_arrow(filepath: str, **kwargs) -> Optional[pd.DataFrame]:
+    """
+    Read a CSV file with PyArrow's multi-threaded parser.
+    
+    Only the pandas arguments that have a direct PyArrow equivalent are
+    translated; anything else makes this return None so the caller can
+    fall back to pd.read_csv(), as do files with duplicate header names,
+    which pandas renames (a, a.1). Missing-value and boolean spellings follow
+    pandas. Columns Arrow would infer as dates or times are read as strings,
+    and columns whose types Arrow infers differently from pandas (all-missing
+    columns, integral values Arrow only parses as floats such as '+2') are
+    read as strings and converted with pd.to_numeric().
+    
+    Args:
+        filepath: Path to the CSV file
+        **kwargs: pd.read_csv() style arguments (sep/delimiter, usecols, dtype_backend)
+        
+    Returns:
+        pd.DataFrame or None if PyArrow is unavailable or the arguments are unsupported
+    """
+    if set(kwargs) - {'sep', 'delimiter', 'usecols', 'dtype_backend'}:
+        return None
+    
+    # Arrow only supports a single-character delimiter and column names in usecols
+    delimiter = kwargs.get('sep', kwargs.get('delimiter', ','))
+    if not isinstance(delimiter, str) or len(delimiter) != 1:
+        return None
+    usecols = kwargs.get('usecols')
+    if usecols is not None and (isinstance(usecols, str) or callable(usecols) or
+                                not all(isinstance(col, str) for col in usecols)):
+        return None
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+    
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=16 << 20)
+    parse_options = pacsv.ParseOptions(delimiter=delimiter)
+    # Like pandas, treat empty and NA-like strings as missing in text columns too
+    convert_options = pacsv.ConvertOptions(
+        strings_can_be_null=True,
+        null_values=_PANDAS_NA_VALUES,
+        true_values=_PANDAS_TRUE_VALUES,
+        false_values=_PANDAS_FALSE_VALUES
+    )
+    if usecols is not None:
+        convert_options.include_columns = list(usecols)
+    
+    # Surface Arrow parse failures as the pandas errors load_data() already handles
+    try:
+        # Infer the schema from the first block
+        with pacsv.open_csv(filepath, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options) as reader:
+            schema = reader.schema
+            try:
+                first_block = reader.read_next_batch()
+            except StopIteration:
+                first_block = None
+        if len(set(schema.names)) != len(schema.names):
+            return None
+        
+        text_cols, numeric_cols = [], []
+        for field in schema:
+            if pa.types.is_temporal(field.type):
+                text_cols.append(field.name)
+            elif pa.types.is_null(field.type):
+                numeric_cols.append(field.name)
+            elif pa.types.is_floating(field.type) and first_block is not None:
+                column = first_block.column(field.name)
+                if column.null_count == 0 and pc.all(pc.equal(column, pc.floor(column))).as_py():
+                    numeric_cols.append(field.name)
+        convert_options.column_types = {name: pa.string() for name in text_cols + numeric_cols}
+        
+        table = pacsv.read_csv(filepath, read_options=read_options,
+                               parse_options=parse_options, convert_options=convert_options)
+    except pa.ArrowInvalid as e:
+        if 'Empty CSV file' in str(e):
+            raise pd.errors.EmptyDataError(str(e))
+        raise pd.errors.ParserError(str(e))
+    
+    if kwargs.get('dtype_backend') == 'pyarrow':
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        df = table.to_pandas()
+    
+    for col in numeric_cols:
+        df[col] = _numeric_or_original(df[col])
+    return df
+
+def optimize_dtypes(df: pd.DataFrame, category_threshold: float = 0.5) -> pd.DataFrame:
+    """
+    Shrink column dtypes to reduce memory use and downstream bandwidth.
+    
+    Integer columns are downcast to the smallest integer type that fits and
+    text columns whose share of unique values is below category_threshold
+    become categoricals. Float columns stay float64, since pandas reduces
+    float32 columns in float32 and the reported statistics would drift.
+    
+    Args:
+        df: DataFrame to optimize
+        category_threshold: Maximum unique-to-row ratio for converting text to category
+        
+    Returns:
+        pd.DataFrame: DataFrame with specialized dtypes
+    """
+    df_opt = df.copy(deep=not _COPY_ON_WRITE)
+    
+    for col in df_opt.select_dtypes(include=[np.number]).columns:
+        dtype = df_opt[col].dtype
+        # Leave extension (nullable/Arrow) dtypes alone
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+            df_opt[col] = pd.to_numeric(df_opt[col], downcast='integer')
+    
+    if len(df_opt) > 0:
+        for col in df_opt.select_dtypes(include=['object', 'string']).columns:
+            if df_opt[col].nunique() / len(df_opt) < category_threshold:
+                df_opt[col] = df_opt[col].astype('category')
+    
+    # Deep memory usage walks every string, so only measure it when it will be logged
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Optimized dtypes: %d → %d bytes",
+                    df.memory_usage(deep=True).sum(), df_opt.memory_usage(deep=True).sum())
+    return df_opt
+
+def _optimized_chunks(reader: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Yield each chunk from a CSV reader with optimize_dtypes() applied."""
+    with reader:
+        for chunk in reader:
+            yield optimize_dtypes(chunk)
+
+def load_data(filepath: str, chunksize: Optional[int] = None,
+              optimize: bool = False,
+              **kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load data from a CSV file with comprehensive error handling.
     
+    Uses PyArrow's CSV reader when it is installed and the arguments allow it,
+    otherwise falls back to pd.read_csv(). Pass dtype_backend='pyarrow' to keep
+    the columns Arrow-backed.
+    
     Args:
         filepath: Path to the CSV file
+        chunksize: If given, return an iterator of DataFrames with this many rows each
+        optimize: Whether to shrink dtypes with optimize_dtypes() (applied per chunk with chunksize)
         **kwargs: Additional arguments for pd.read_csv()
     
     Returns:
-        pd.DataFrame: Loaded data
+        pd.DataFrame: Loaded data, or an iterator of chunks when chunksize is set
         
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -38,13 +206,26 @@ def load_data(filepath: str, **kwargs) -> pd.DataFrame:
         raise FileNotFoundError(f"File not found: {filepath}")
     
     try:
-        df = pd.read_csv(filepath, **kwargs)
+        if chunksize:
+            reader = pd.read_csv(filepath, chunksize=chunksize, **kwargs)
+            logger.info("Streaming %s in chunks of %d rows", filepath, chunksize)
+            if optimize:
+                return _optimized_chunks(reader)
+            return reader
+        
+        df = _read_csv_arrow(filepath, **kwargs)
+        if df is None:
+            df = pd.read_csv(filepath, **kwargs)
         
         if df.empty:
             raise ValueError(f"File is empty: {filepath}")
             
-        logger.info(f"Successfully loaded {len(df)} rows from {filepath}")
-        logger.info(f"Columns: {list(df.columns)}")
+        logger.info("Successfully loaded %d rows from %s", len(df), filepath)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Columns: %s", list(df.columns))
+        
+        if optimize:
+            df = optimize_dtypes(df)
         
         return df
         
@@ -73,38 +254,177 @@ def validate_data(df: pd.DataFrame, required_columns: Optional[list] = None) ->
         raise ValueError("DataFrame is empty")
     
     if required_columns:
-        missing_cols = [col for col in required_columns if col not in df.columns]
+        available_cols = set(df.columns)
+        missing_cols = [col for col in required_columns if col not in available_cols]
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
     
-    logger.info(f"Data validation passed - Shape: {df.shape}")
+    logger.info("Data validation passed - Shape: %s", df.shape)
+    return df
+
+def _strip_text(series: pd.Series) -> pd.Series:
+    """Strip whitespace from a text column, casting to str only when needed."""
+    # Categoricals only need their (few) categories stripped
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories.astype(str).str.strip()
+        if categories.is_unique:
+            return series.cat.rename_categories(categories)
+        return series.astype(str).str.strip().astype('category')
+    
+    # String and ArrowDtype string columns strip natively (the latter via
+    # pyarrow.compute.utf8_trim_whitespace); only mixed object columns need a cast
+    if pd.api.types.is_object_dtype(series) and \
+            pd.api.types.infer_dtype(series, skipna=True) != 'string':
+        series = series.astype(str)
+    return series.str.strip()
+
+def _dtype_names(df: pd.DataFrame) -> Tuple[str, ...]:
+    """Return the dtype names of a DataFrame (plain strings, so attrs stay serializable)."""
+    return tuple(str(dtype) for dtype in df.dtypes)
+
+def _column_groups(df: pd.DataFrame) -> Tuple[list, list]:
+    """
+    Split the columns of a DataFrame into numeric and text column names.
+    
+    preprocess_data() records the groups in df.attrs['column_groups'], and
+    they are reused for as long as the column names and dtypes are unchanged.
+    
+    Returns:
+        Tuple of (numeric column names, text column names)
+    """
+    cached = df.attrs.get('column_groups')
+    if cached is not None and cached[0] == tuple(df.columns) and cached[1] == _dtype_names(df):
+        return cached[2], cached[3]
+    
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    text_cols = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+    return numeric_cols, text_cols
+
+def _strip_text_cols(df: pd.DataFrame, text_cols: Optional[list] = None) -> pd.DataFrame:
+    """Strip whitespace from the text columns of a DataFrame."""
+    if text_cols is None:
+        text_cols = _column_groups(df)[1]
+    if len(text_cols) > 0:
+        df[text_cols] = df[text_cols].apply(_strip_text)
     return df
 
+def _strip_text_cols_dask(df: pd.DataFrame, text_cols: list) -> pd.DataFrame:
+    """
+    Strip text columns in parallel across row partitions with Dask.
+    
+    Rows keep their order and columns their dtypes, so the result matches
+    _strip_text_cols(). Dask's default threaded scheduler is used; the
+    processes scheduler can be enabled with dask.config.set(scheduler='processes'),
+    which requires the calling script to have an ``if __name__ == '__main__'`` guard.
+    Falls back to _strip_text_cols() when Dask is not installed.
+    """
+    try:
+        import dask
+        import dask.dataframe as dd
+    except ImportError:
+        logger.warning("Dask is not installed, falling back to the pandas engine")
+        return _strip_text_cols(df, text_cols)
+    
+    # Keep pandas' string dtypes instead of Dask's automatic pyarrow strings
+    with dask.config.set({'dataframe.convert-string': False}):
+        ddf = dd.from_pandas(df, npartitions=os.cpu_count() or 1, sort=False)
+        return ddf.map_partitions(_strip_text_cols, text_cols).compute()
+
+# Rows sampled to decide between drop_duplicates() and row hashing
+_DEDUP_PROBE_ROWS = 10_000
+
+def _row_hashing_pays_off(df: pd.DataFrame) -> bool:
+    """
+    Estimate from a row sample whether row hashing beats drop_duplicates().
+    
+    drop_duplicates() packs per-column codes into one int64 key, which is
+    fast while the product of column cardinalities fits in 64 bits or rows
+    repeat heavily. Row hashing only wins when neither holds.
+    """
+    if len(df) <= _DEDUP_PROBE_ROWS:
+        return False
+    
+    # Drawing positions with replacement avoids permuting the whole index
+    positions = np.unique(np.random.default_rng(0).integers(0, len(df), _DEDUP_PROBE_ROWS))
+    probe = df.take(positions)
+    if probe.duplicated().mean() > 0.01:
+        return False
+    
+    # Columns mostly unique in the sample are assumed unique in the frame
+    nunique = probe.nunique(dropna=False).to_numpy()
+    key_bits = np.where(nunique >= len(probe) // 2, np.log2(len(df)),
+                        np.log2(np.maximum(nunique, 2))).sum()
+    return key_bits > 64
+
+def _drop_duplicates_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drop duplicate rows of an all-numeric DataFrame via 64-bit row hashes.
+    
+    Only rows whose hash occurs more than once are compared exactly with
+    drop_duplicates() semantics, so hash collisions never drop a row. Frames
+    that drop_duplicates() handles faster are passed straight to it.
+    """
+    if not _row_hashing_pays_off(df):
+        return df.drop_duplicates()
+    
+    # Hashes use the raw float bits, so map every NaN payload to one NaN and
+    # -0.0 to 0.0, which drop_duplicates() treats as equal
+    float_cols = [col for col, dtype in df.dtypes.items() if dtype.kind == 'f']
+    keys = df
+    if float_cols:
+        keys = df.copy(deep=False)
+        float_block = keys[float_cols]
+        keys[float_cols] = float_block.where(float_block.notna(), np.nan) + 0.0
+    
+    row_hashes = pd.util.hash_pandas_object(keys, index=False)
+    shared = row_hashes.duplicated(keep=False).to_numpy()
+    
+    duplicated = np.zeros(len(df), dtype=bool)
+    if shared.any():
+        duplicated[shared] = df[shared].duplicated().to_numpy()
+    return df[~duplicated]
+
 def preprocess_data(df: pd.DataFrame, drop_na: bool = True, 
-                   fill_na: bool = False, fill_method: str = 'mean') -> pd.DataFrame:
+                   fill_na: bool = False, fill_method: str = 'mean',
+                   engine: str = 'pandas', copy: bool = False) -> pd.DataFrame:
     """
     Preprocess the data with multiple cleaning options.
     
+    Under Copy-on-Write the result shares unmodified column data with df
+    instead of duplicating the whole frame up front; df itself is never
+    changed either way. The numeric and text column names are stored in
+    the result's attrs so analyze_data() does not re-inspect the dtypes.
+    
     Args:
         df: Input DataFrame
         drop_na: Whether to drop rows with NA values
         fill_na: Whether to fill NA values instead of dropping
         fill_method: Method for filling NA ('mean', 'median', 'mode', 'forward', 'backward')
+        engine: Backend for the row-wise text cleaning ('pandas' or 'dask')
+        copy: Whether to deep-copy df eagerly even when Copy-on-Write is available
         
     Returns:
         pd.DataFrame: Preprocessed data
+        
+    Raises:
+        ValueError: If engine is not supported
     """
+    if engine not in ('pandas', 'dask'):
+        raise ValueError(f"Unsupported engine: {engine}")
+    
     original_shape = df.shape
-    df_clean = df.copy()
+    df_clean = df.copy(deep=copy or not _COPY_ON_WRITE)
+    numeric_cols, text_cols = _column_groups(df_clean)
+    initial_dtypes = _dtype_names(df_clean)
     
     # Handle missing values
     if fill_na and not drop_na:
-        numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
-        
+        # Filling with a per-column Series only touches those columns, so the
+        # numeric block is sliced once and never assigned back
         if fill_method == 'mean':
-            df_clean[numeric_cols] = df_clean[numeric_cols].fillna(df_clean[numeric_cols].mean())
+            df_clean = df_clean.fillna(df_clean[numeric_cols].mean())
         elif fill_method == 'median':
-            df_clean[numeric_cols] = df_clean[numeric_cols].fillna(df_clean[numeric_cols].median())
+            df_clean = df_clean.fillna(df_clean[numeric_cols].median())
         elif fill_method == 'forward':
             df_clean = df_clean.fillna(method='ffill')
         elif fill_method == 'backward':
@@ -112,83 +432,267 @@ def preprocess_data(df: pd.DataFrame, drop_na: bool = True,
         else:
             df_clean = df_clean.fillna(df_clean.mode().iloc[0])
             
-        logger.info(f"Filled NA values using {fill_method} method")
+        logger.info("Filled NA values using %s method", fill_method)
         
     elif drop_na:
         df_clean = df_clean.dropna()
-        logger.info(f"Dropped rows with NA values")
+        logger.info("Dropped rows with NA values")
     
     # Remove duplicates
     initial_len = len(df_clean)
-    df_clean = df_clean.drop_duplicates()
+    if numeric_cols and len(numeric_cols) == df_clean.shape[1]:
+        df_clean = _drop_duplicates_numeric(df_clean)
+    else:
+        df_clean = df_clean.drop_duplicates()
     duplicates_removed = initial_len - len(df_clean)
     
     if duplicates_removed > 0:
-        logger.info(f"Removed {duplicates_removed} duplicate rows")
+        logger.info("Removed %d duplicate rows", duplicates_removed)
     
     # Clean text columns (strip whitespace, standardize case)
-    text_cols = df_clean.select_dtypes(include=['object']).columns
-    for col in text_cols:
-        if df_clean[col].dtype == 'object':
-            df_clean[col] = df_clean[col].astype(str).str.strip()
+    if engine == 'dask':
+        df_clean = _strip_text_cols_dask(df_clean, text_cols)
+    else:
+        df_clean = _strip_text_cols(df_clean, text_cols)
+    
+    # Filling and stripping can change dtypes (e.g. mixed object to str), so
+    # only record the groups computed above if they still describe the frame
+    final_dtypes = _dtype_names(df_clean)
+    if final_dtypes != initial_dtypes:
+        numeric_cols, text_cols = _column_groups(df_clean)
+    df_clean.attrs['column_groups'] = (tuple(df_clean.columns), final_dtypes, numeric_cols, text_cols)
+    
+    logger.info("Preprocessing complete: %s → %s", original_shape, df_clean.shape)
+    
+    return df_clean
+
+def process_in_chunks(filepath: str, chunksize: int,
+                      preprocess_kwargs: Optional[Dict[str, Any]] = None,
+                      optimize: bool = False) -> pd.DataFrame:
+    """
+    Load and preprocess a large CSV file one chunk at a time.
+    
+    Only one raw chunk is held in memory at once; the cleaned chunks are
+    concatenated and de-duplicated across chunk boundaries at the end.
+    Note that fill_na statistics (mean, median, ...) are computed per chunk.
+    With optimize, each raw chunk is shrunk before preprocessing, and the
+    result is optimized once more so categories agree across chunks.
+    
+    Args:
+        filepath: Path to the CSV file
+        chunksize: Number of rows per chunk
+        preprocess_kwargs: Keyword arguments forwarded to preprocess_data()
+        optimize: Whether to shrink dtypes with optimize_dtypes()
+        
+    Returns:
+        pd.DataFrame: Preprocessed data
+        
+    Raises:
+        ValueError: If the file contains no rows
+    """
+    preprocess_kwargs = preprocess_kwargs or {}
+    
+    clean_chunks = [
+        preprocess_data(chunk, **preprocess_kwargs)
+        for chunk in load_data(filepath, chunksize=chunksize, optimize=optimize)
+    ]
+    if not clean_chunks:
+        raise ValueError(f"File is empty: {filepath}")
     
-    final_shape = df_clean.shape
-    logger.info(f"Preprocessing complete: {original_shape} → {final_shape}")
+    df_clean = pd.concat(clean_chunks).drop_duplicates()
+    if optimize:
+        df_clean = optimize_dtypes(df_clean)
+    logger.info("Processed %d chunks from %s: %s", len(clean_chunks), filepath, df_clean.shape)
     
     return df_clean
 
+def _correlation_matrix(df: pd.DataFrame, numeric_cols: list) -> pd.DataFrame:
+    """
+    Compute the Pearson correlation matrix of the numeric columns.
+    
+    Uses np.corrcoef on a single float64 block when the data has no missing
+    values; otherwise defers to pandas' pairwise-complete DataFrame.corr().
+    
+    Args:
+        df: DataFrame to analyze
+        numeric_cols: Names of the numeric columns to correlate
+        
+    Returns:
+        pd.DataFrame: Correlation matrix indexed by numeric_cols on both axes
+    """
+    arr = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    if len(arr) < 2 or np.isnan(arr).any():
+        return df[numeric_cols].corr()
+    
+    # Constant columns have zero variance and correlate as NaN, as in pandas
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.corrcoef(arr, rowvar=False)
+    corr = (corr + corr.T) / 2  # corrcoef is only symmetric up to rounding
+    np.fill_diagonal(corr, np.where(np.isnan(np.diag(corr)), np.nan, 1.0))
+    return pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols)
+
+def _digest_column(digest: 'hashlib._Hash', series: pd.Series) -> None:
+    """
+    Feed a column's values, in row order, into a running digest.
+    
+    NumPy columns and Arrow string columns are digested from their raw
+    buffers; other columns fall back to pandas' per-row hashes.
+    
+    Raises:
+        TypeError: If the column holds unhashable values
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufcmM':
+        digest.update(np.ascontiguousarray(series.to_numpy()).view(np.uint8))
+        return
+    
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        try:
+            import pyarrow as pa
+            values = pa.array(series, from_pandas=True)
+        except ImportError:
+            values = None
+        except (pa.ArrowException, ValueError, TypeError):
+            values = None
+        if values is not None and (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+            chunks = values.chunks if isinstance(values, pa.ChunkedArray) else [values]
+            for chunk in chunks:
+                # Buffer sizes and the slice offset keep the byte stream unambiguous
+                digest.update(repr((chunk.offset, [None if buf is None else buf.size
+                                                  for buf in chunk.buffers()])).encode())
+                for buf in chunk.buffers():
+                    if buf is not None:
+                        digest.update(buf)
+            return
+    
+    digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy())
+
+def _frame_fingerprint(df: pd.DataFrame) -> Optional[Tuple]:
+    """
+    Build a cheap, hashable fingerprint of a DataFrame's shape, schema and content.
+    
+    Returns:
+        Tuple fingerprint, or None if the frame holds unhashable values
+    """
+    # Digest values in row order, since results depend on row order (e.g. mode ties)
+    digest = hashlib.sha1()
+    try:
+        for _, series in df.items():
+            _digest_column(digest, series)
+    except TypeError:
+        return None
+    return (df.shape, tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes), digest.hexdigest())
+
+# In-process LRU cache of analyze_data() results keyed by frame fingerprint and options
+_ANALYSIS_CACHE_SIZE = 8
+_analysis_cache: 'OrderedDict[Tuple, Dict[str, Any]]' = OrderedDict()
+
+def _cache_analysis(key: Tuple, analysis_results: Dict[str, Any]) -> None:
+    """Store analysis results in the in-process cache, evicting the least recently used."""
+    _analysis_cache[key] = analysis_results
+    _analysis_cache.move_to_end(key)
+    while len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+
 def analyze_data(df: pd.DataFrame, include_correlations: bool = True, 
-                custom_analysis: bool = True) -> Dict[str, Any]:
+                custom_analysis: bool = True, use_cache: bool = False,
+                cache_dir: Optional[str] = None) -> Dict[str, Any]:
     """
     Perform comprehensive data analysis.
     
+    With caching enabled, results are memoized on a fingerprint of the
+    DataFrame, so analyzing identical data again returns a copy of the
+    earlier results (including their analysis timestamp). The most recent
+    results are kept in memory; with cache_dir set, results are also pickled
+    to disk and reused across runs. Fingerprinting reads every value, so
+    caching only pays off when the same data is analyzed repeatedly.
+    
     Args:
         df: DataFrame to analyze
         include_correlations: Whether to include correlation analysis
         custom_analysis: Whether to include custom metrics
+        use_cache: Whether to reuse results for identical data (implied by cache_dir)
+        cache_dir: Directory for the persistent result cache (None keeps it in memory only)
         
     Returns:
         Dict containing analysis results
     """
+    fingerprint = _frame_fingerprint(df) if use_cache or cache_dir else None
+    if fingerprint is None:
+        return _compute_analysis(df, include_correlations, custom_analysis)
+    
+    key = fingerprint + (include_correlations, custom_analysis)
+    if key in _analysis_cache:
+        _analysis_cache.move_to_end(key)
+        logger.info("Reusing cached analysis results")
+        return copy.deepcopy(_analysis_cache[key])
+    
+    cache_path = None
+    if cache_dir:
+        setup_directories(cache_dir)
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        cache_path = os.path.join(cache_dir, f"analysis_{digest}.pkl")
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                analysis_results = pickle.load(f)
+            _cache_analysis(key, analysis_results)
+            logger.info("Loaded cached analysis results: %s", cache_path)
+            return copy.deepcopy(analysis_results)
+    
+    analysis_results = _compute_analysis(df, include_correlations, custom_analysis)
+    _cache_analysis(key, analysis_results)
+    if cache_path:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(analysis_results, f)
+    
+    return copy.deepcopy(analysis_results)
+
+def _compute_analysis(df: pd.DataFrame, include_correlations: bool,
+                      custom_analysis: bool) -> Dict[str, Any]:
+    """Compute the analyze_data() results without consulting the cache."""
     analysis_results = {}
     
-    # Basic statistics
-    analysis_results['basic_stats'] = df.describe()
+    # Basic statistics (computed once and reused below)
+    basic_stats = df.describe()
+    null_counts = df.isnull().sum()
+    analysis_results['basic_stats'] = basic_stats
     analysis_results['shape'] = df.shape
     analysis_results['dtypes'] = df.dtypes.to_dict()
-    analysis_results['null_counts'] = df.isnull().sum().to_dict()
+    analysis_results['null_counts'] = null_counts.to_dict()
     
     # Numeric columns analysis
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    numeric_cols, categorical_cols = _column_groups(df)
     if numeric_cols:
         analysis_results['numeric_columns'] = numeric_cols
         analysis_results['numeric_summary'] = {
             'total_numeric_cols': len(numeric_cols),
-            'mean_values': df[numeric_cols].mean().to_dict(),
-            'std_values': df[numeric_cols].std().to_dict()
+            'mean_values': basic_stats.loc['mean', numeric_cols].to_dict(),
+            'std_values': basic_stats.loc['std', numeric_cols].to_dict()
         }
         
         # Correlations
         if include_correlations and len(numeric_cols) > 1:
-            analysis_results['correlations'] = df[numeric_cols].corr().to_dict()
+            analysis_results['correlations'] = _correlation_matrix(df, numeric_cols).to_dict()
     
     # Categorical columns analysis
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
     if categorical_cols:
         analysis_results['categorical_columns'] = categorical_cols
         analysis_results['categorical_summary'] = {}
         
         for col in categorical_cols:
+            # A single value_counts() pass yields the unique count, mode and top values
+            value_counts = df[col].value_counts()
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                value_counts = value_counts[value_counts > 0]  # Drop unused categories
             analysis_results['categorical_summary'][col] = {
-                'unique_count': df[col].nunique(),
-                'most_frequent': df[col].mode().iloc[0] if not df[col].empty else None,
-                'value_counts': df[col].value_counts().head().to_dict()
+                'unique_count': len(value_counts),
+                'most_frequent': value_counts.index[0] if not value_counts.empty else None,
+                'value_counts': value_counts.head().to_dict()
             }
     
     # Custom analysis
     if custom_analysis:
         analysis_results['custom_metrics'] = {
-            'data_completeness': (1 - df.isnull().sum().sum() / (df.shape[0] * df.shape[1])) * 100,
+            'data_completeness': (1 - null_counts.sum() / df.size) * 100,
             'duplicate_rate': (df.duplicated().sum() / len(df)) * 100,
             'analysis_timestamp': datetime.now().isoformat()
         }
@@ -233,9 +737,12 @@ def generate_report(analysis_results: Dict[str, Any]) -> str:
             "-" * 30
         ])
         
-        for col, mean_val in analysis_results['numeric_summary']['mean_values'].items():
-            std_val = analysis_results['numeric_summary']['std_values'][col]
-            report_lines.append(f"{col}: Mean={mean_val:.2f}, Std={std_val:.2f}")
+        mean_values = analysis_results['numeric_summary']['mean_values']
+        std_values = analysis_results['numeric_summary']['std_values']
+        report_lines.extend([
+            f"{col}: Mean={mean_val:.2f}, Std={std_values[col]:.2f}"
+            for col, mean_val in mean_values.items()
+        ])
         
         report_lines.append("")
     
@@ -246,8 +753,10 @@ def generate_report(analysis_results: Dict[str, Any]) -> str:
             "-" * 30
         ])
         
-        for col, info in analysis_results['categorical_summary'].items():
-            report_lines.append(f"{col}: {info['unique_count']} unique values")
+        report_lines.extend([
+            f"{col}: {info['unique_count']} unique values"
+            for col, info in analysis_results['categorical_summary'].items()
+        ])
         
         report_lines.append("")
     
@@ -255,14 +764,95 @@ def generate_report(analysis_results: Dict[str, Any]) -> str:
     
     return "\n".join(report_lines)
 
-def save_results(results: Any, filepath: str, include_report: bool = True) -> Dict[str, str]:
+def _write_parquet(frame: pd.DataFrame, path: str) -> bool:
+    """
+    Write a DataFrame to zstd-compressed Parquet.
+    
+    Returns:
+        bool: False if nothing was written because PyArrow is not installed
+        or the frame cannot be stored as Parquet (e.g. mixed-type object
+        columns, complex numbers or duplicate column names)
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        logger.warning("PyArrow is not installed, skipping Parquet output: %s", path)
+        return False
+    
+    # Parquet requires string column names
+    try:
+        frame.rename(columns=str).to_parquet(path, engine='pyarrow', compression='zstd', index=True)
+    except (pa.ArrowException, ValueError) as e:
+        logger.warning("Skipping Parquet output %s: %s", path, e)
+        return False
+    return True
+
+def _write_json(obj: Any, path: str) -> None:
+    """Write an object as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, default=str)
+        return
+    
+    options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, default=str, option=options))
+
+def _write_excel(frame: pd.DataFrame, path: str) -> None:
+    """
+    Write a DataFrame to Excel, streaming rows with xlsxwriter when it is installed.
+    
+    xlsxwriter's constant_memory mode flushes each row to disk instead of
+    building the whole workbook in memory, but it requires row-by-row writes,
+    which DataFrame.to_excel() does not do, so the rows are written here.
+    Frames with a MultiIndex on either axis, whose merged header cells this
+    simple writer does not reproduce, still go through to_excel().
+    """
+    multi_index = isinstance(frame.index, pd.MultiIndex) or isinstance(frame.columns, pd.MultiIndex)
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+    if xlsxwriter is None or multi_index:
+        frame.to_excel(path, index=True)
+        return
+    
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet('Sheet1')
+        datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+        date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        
+        worksheet.write_row(0, 0, [frame.index.name or ''] + [str(col) for col in frame.columns])
+        for row, values in enumerate(frame.itertuples(name=None), start=1):
+            for col, value in enumerate(values):
+                if pd.isna(value):
+                    continue  # Leave missing values blank, as to_excel() does
+                if isinstance(value, datetime):
+                    worksheet.write_datetime(row, col, value, datetime_format)
+                elif isinstance(value, date):
+                    worksheet.write_datetime(row, col, value, date_format)
+                else:
+                    worksheet.write(row, col, value)
+    finally:
+        workbook.close()
+
+def save_results(results: Any, filepath: str, include_report: bool = True,
+                 include_excel: bool = False) -> Dict[str, str]:
     """
     Save analysis results to files with multiple formats.
     
+    DataFrames are written as CSV and, when PyArrow is installed, as
+    zstd-compressed Parquet; Excel output is opt-in.
+    
     Args:
         results: Results to save (DataFrame or Dict)
         filepath: Base filepath for saving
         include_report: Whether to generate and save a text report
+        include_excel: Whether to also save DataFrame results as Excel
         
     Returns:
         Dict mapping file types to their paths
@@ -281,42 +871,52 @@ def save_results(results: Any, filepath: str, include_report: bool = True) -> Di
             csv_path = f"{base_name}.csv"
             results.to_csv(csv_path, index=True)
             saved_files['csv'] = csv_path
-            logger.info(f"Results saved to CSV: {csv_path}")
+            logger.info("Results saved to CSV: %s", csv_path)
+            
+            # Save as Parquet
+            parquet_path = f"{base_name}.parquet"
+            if _write_parquet(results, parquet_path):
+                saved_files['parquet'] = parquet_path
+                logger.info("Results saved to Parquet: %s", parquet_path)
             
             # Save as Excel
-            excel_path = f"{base_name}.xlsx"
-            results.to_excel(excel_path, index=True)
-            saved_files['excel'] = excel_path
-            logger.info(f"Results saved to Excel: {excel_path}")
+            if include_excel:
+                excel_path = f"{base_name}.xlsx"
+                _write_excel(results, excel_path)
+                saved_files['excel'] = excel_path
+                logger.info("Results saved to Excel: %s", excel_path)
             
         elif isinstance(results, dict):
-            # Save dictionary results
-            import json
-            
             # Handle basic stats DataFrame in the dictionary
             results_copy = results.copy()
             if 'basic_stats' in results_copy and isinstance(results_copy['basic_stats'], pd.DataFrame):
                 csv_path = f"{base_name}.csv"
                 results_copy['basic_stats'].to_csv(csv_path)
                 saved_files['csv'] = csv_path
-                logger.info(f"Basic stats saved to CSV: {csv_path}")
+                logger.info("Basic stats saved to CSV: %s", csv_path)
             
             # Save full results as JSON
             json_path = f"{base_name}.json"
-            # Convert non-serializable objects
+            # Store DataFrames as Parquet sidecar files referenced by path
+            # relative to the JSON file, inlining them only when they cannot
+            # be written as Parquet
             serializable_results = {}
             for key, value in results_copy.items():
                 if isinstance(value, pd.DataFrame):
-                    serializable_results[key] = value.to_dict()
+                    sidecar_path = f"{base_name}_{key}.parquet"
+                    if _write_parquet(value, sidecar_path):
+                        serializable_results[key] = os.path.basename(sidecar_path)
+                        saved_files[f'parquet_{key}'] = sidecar_path
+                    else:
+                        serializable_results[key] = value.to_dict()
                 elif isinstance(value, pd.Series):
                     serializable_results[key] = value.to_dict()
                 else:
                     serializable_results[key] = value
             
-            with open(json_path, 'w') as f:
-                json.dump(serializable_results, f, indent=2, default=str)
+            _write_json(serializable_results, json_path)
             saved_files['json'] = json_path
-            logger.info(f"Full results saved to JSON: {json_path}")
+            logger.info("Full results saved to JSON: %s", json_path)
             
             # Generate and save report
             if include_report:
@@ -325,47 +925,86 @@ def save_results(results: Any, filepath: str, include_report: bool = True) -> Di
                 with open(report_path, 'w') as f:
                     f.write(report)
                 saved_files['report'] = report_path
-                logger.info(f"Report saved: {report_path}")
+                logger.info("Report saved: %s", report_path)
         
         return saved_files
         
     except Exception as e:
-        logger.error(f"Error saving results: {str(e)}")
+        logger.error("Error saving results: %s", e)
         raise
 
-def create_sample_data(filepath: str, num_rows: int = 100) -> pd.DataFrame:
+def _person_names(start: int, stop: int) -> Any:
+    """Build 'Person_<i>' labels for i in [start, stop) with PyArrow string kernels."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return [f'Person_{i}' for i in range(start, stop)]
+    
+    ids = pa.array(np.arange(start, stop)).cast(pa.string())
+    return pc.binary_join_element_wise('Person_', ids, '').to_pandas()
+
+def _sample_dates(start: int, stop: int) -> pd.DatetimeIndex:
+    """Return days [start, stop) after 2023-01-01, matching pd.date_range()'s resolution."""
+    unit = pd.date_range('2023-01-01', periods=1, freq='D').unit
+    days = np.datetime64('2023-01-01', 'D') + np.arange(start, stop).astype('timedelta64[D]')
+    return pd.DatetimeIndex(days).as_unit(unit)
+
+def _sample_batch(start: int, stop: int) -> pd.DataFrame:
+    """Generate sample rows [start, stop) using the global NumPy random state."""
+    num_rows = stop - start
+    
+    age = np.random.randint(18, 80, num_rows).astype(np.float64)
+    score = np.random.normal(85, 10, num_rows).round(1)
+    category = np.random.choice(['A', 'B', 'C'], num_rows)
+    
+    # Add some missing values for testing
+    score[np.random.choice(num_rows, 5)] = np.nan
+    age[np.random.choice(num_rows, 3)] = np.nan
+    
+    batch = pd.DataFrame({
+        'Name': _person_names(start + 1, stop + 1),
+        'Age': age,
+        'Score': score,
+        'Category': category,
+        'Date': _sample_dates(start, stop)
+    })
+    batch.index = pd.RangeIndex(start, stop)
+    return batch
+
+def create_sample_data(filepath: str, num_rows: int = 100, batch_size: int = 100_000,
+                       return_data: bool = True) -> Optional[pd.DataFrame]:
     """
     Create sample data for testing purposes.
     
+    Rows are generated and appended to the CSV file in batches, so only one
+    batch is held in memory unless the full data is requested back. Each
+    batch receives its own missing values.
+    
     Args:
         filepath: Path where to save the sample data
         num_rows: Number of rows to generate
+        batch_size: Number of rows generated and written at a time
+        return_data: Whether to collect and return the generated data
         
     Returns:
-        pd.DataFrame: Generated sample data
+        pd.DataFrame: Generated sample data, or None if return_data is False
     """
     np.random.seed(42)  # For reproducible results
     
-    sample_data = pd.DataFrame({
-        'Name': [f'Person_{i}' for i in range(1, num_rows + 1)],
-        'Age': np.random.randint(18, 80, num_rows),
-        'Score': np.random.normal(85, 10, num_rows).round(1),
-        'Category': np.random.choice(['A', 'B', 'C'], num_rows),
-        'Date': pd.date_range('2023-01-01', periods=num_rows, freq='D')
-    })
-    
-    # Add some missing values for testing
-    sample_data.loc[np.random.choice(sample_data.index, 5), 'Score'] = np.nan
-    sample_data.loc[np.random.choice(sample_data.index, 3), 'Age'] = np.nan
-    
     # Ensure directory exists
     setup_directories(os.path.dirname(filepath))
     
-    # Save sample data
-    sample_data.to_csv(filepath, index=False)
-    logger.info(f"Sample data created: {filepath} ({len(sample_data)} rows)")
+    batches = []
+    for start in range(0, num_rows, batch_size):
+        batch = _sample_batch(start, min(start + batch_size, num_rows))
+        batch.to_csv(filepath, index=False, mode='w' if start == 0 else 'a', header=start == 0)
+        if return_data:
+            batches.append(batch)
+    
+    logger.info("Sample data created: %s (%d rows)", filepath, num_rows)
     
-    return sample_data
+    return pd.concat(batches) if return_data else None
 
 def print_summary(results: Dict[str, Any]) -> None:
     """Print a summary of analysis results to console."""